@@ -12,9 +12,6 @@ managers with all the advantages of functions over syntax.
 # This variant is a stopgap until that's fixed, relying only
 # on ``with`` and bidirectional ``yield``.
 
-from sys import exc_info as _exc_info
-
-
 __all__ = ('with_', 'iwith')
 __version__ = '1.1.0'
 
@@ -72,7 +69,7 @@ def iwith(manager, action):
         while True:
             try:
                 if thrown is not None:
-                    value = throw(*thrown)
+                    value = throw(thrown)
                 elif sent is not None:
                     value = iterator.send(sent)
                 else:
@@ -98,12 +95,12 @@ def iwith(manager, action):
                             pass
                         raise
                 raise
-            except:
+            except BaseException as error:
                 try:
                     throw = iterator.throw
                 except AttributeError:
                     throw = None
                 if throw is None:
                     raise
-                thrown = _exc_info()
+                thrown = error
     return None